@@ -0,0 +1 @@
+# Keeps the repository root on sys.path so tests can import the sheathing package
@@ -0,0 +1,6 @@
+"""
+Shared sheathing calculator modules used by both app directories.
+
+core.py holds the numeric core, utils.py the result formatting and ui.py the
+Streamlit widgets.
+"""
@@ -0,0 +1,47 @@
+"""
+Compile the numeric core ahead of time into the sheathing_core extension.
+
+Run from the repository root (requires numba and a C compiler):
+
+    python -m sheathing.build_core
+
+Nothing in .replit or pyproject.toml runs this. It is a manual step for the
+deployment image, after installing the "jit" extra. core.py picks up the
+compiled module automatically and falls back to the numba JIT (or plain
+Python) when it is missing. The build records a hash of the numeric core
+source. If _sheathing_core or _porch_core is edited afterwards, core.py warns
+and ignores the stale module until it is rebuilt.
+
+numba.pycc has been pending deprecation since numba 0.57 and emits
+NumbaPendingDeprecationWarning. When it is removed, drop this script: the
+@njit(cache=True) path in core.py needs no build step.
+"""
+import sys
+from pathlib import Path
+
+# Make sure core exposes its own functions, not a previously built module
+sys.modules['sheathing.sheathing_core'] = None
+
+from numba.pycc import CC
+from sheathing import core
+
+SOURCE_HASH = core._core_source_hash()
+
+cc = CC('sheathing_core')
+cc.output_dir = str(Path(__file__).parent)
+
+cc.export(
+    'calc_core',
+    'Tuple((i8, f8, i8, f8, f8, f8, f8[:]))(f8, f8, f8, f8, f8, f8)'
+)(core._sheathing_core.py_func)
+cc.export(
+    'porch_core',
+    'Tuple((i8, f8, f8, f8))(f8, f8, f8, f8, f8)'
+)(core._porch_core.py_func)
+
+@cc.export('source_hash', 'i8()')
+def source_hash():
+    return SOURCE_HASH
+
+if __name__ == "__main__":
+    cc.compile()
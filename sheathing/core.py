@@ -0,0 +1,323 @@
+import hashlib
+import inspect
+import math
+import warnings
+from functools import lru_cache
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is the optional "jit" extra; fall back to plain Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+@njit(cache=True)
+def _sheathing_core(length, width, height, pitch, overhang, sheet_width):
+    """
+    Numeric core of calculate_sheathing for the main building.
+
+    Kept free of Python objects so it compiles in numba's nopython mode.
+
+    Returns:
+        tuple: (eave_wall_sheets, wall_sheet_length, total_roof_sheets,
+            roof_sheet_length, gable_width, eave_length, gable_sheet_lengths)
+    """
+    # Convert sheet width and overhang from inches to feet
+    sheet_width_ft = sheet_width / 12
+    overhang_ft = overhang / 12
+
+    # Adjust building dimensions for overhang
+    gable_width = width + 2 * overhang_ft  # Include overhang
+    eave_length = length + 2 * overhang_ft  # Include overhang
+    half_gable_width = gable_width / 2  # Half-width for triangle calculations
+
+    # Calculate peak height using pitch
+    peak_height = (half_gable_width) * (pitch / 12)
+
+    # Calculate number of sheets needed for one side of gable
+    sheets_per_side = math.ceil(width / (2 * sheet_width_ft))
+
+    # Calculate rise increment per sheet width
+    rise_per_sheet_inches = math.ceil((sheet_width * pitch) / 12)  # Round up to nearest inch
+
+    # Generate ascending and descending gable sheet lengths. Rise per sheet is
+    # a whole number of inches, so the progression is exact integer inches
+    # once the wall height is rounded to the nearest inch. Half inches round
+    # up so sheets are never ordered short.
+    start_inches = np.floor(height * 12 + 0.5) + rise_per_sheet_inches  # First increment above wall height
+
+    # Degenerate widths (zero or negative) have no gable sheets
+    n = max(sheets_per_side, 0)
+    gable_sheet_lengths = np.empty(2 * n)
+
+    # Ascending lengths in whole inches, converted to feet; each value is
+    # written to its mirrored descending slot in the same pass
+    for i in range(n):
+        sheet_length = (start_inches + i * rise_per_sheet_inches) / 12
+        gable_sheet_lengths[i] = sheet_length
+        gable_sheet_lengths[2 * n - 1 - i] = sheet_length
+
+    # Walls
+    eave_wall_sheets = math.ceil(length / sheet_width_ft) * 2
+    wall_sheet_length = height
+
+    # Roof
+    roof_run = half_gable_width
+    roof_slope_length = math.hypot(roof_run, peak_height)
+    roof_length = length + 2 * overhang_ft
+    roof_sheets_per_side = math.ceil(roof_length / sheet_width_ft)
+    roof_sheet_length = math.ceil(roof_slope_length * 2) / 2  # Round up to 0.5'
+    total_roof_sheets = roof_sheets_per_side * 2
+
+    return (eave_wall_sheets, wall_sheet_length, total_roof_sheets,
+            roof_sheet_length, gable_width, eave_length, gable_sheet_lengths)
+
+@njit(cache=True)
+def _porch_core(porch_length, porch_depth, porch_pitch, overhang, sheet_width):
+    """
+    Numeric core of the porch roof calculation.
+
+    Returns:
+        tuple: (porch_sheets, porch_sheet_length, porch_linear_feet, porch_perimeter)
+    """
+    # Convert sheet width and overhang from inches to feet
+    sheet_width_ft = sheet_width / 12
+    overhang_ft = overhang / 12
+
+    # Calculate porch roof dimensions
+    porch_run = porch_depth + overhang_ft
+    porch_rise = (porch_run * porch_pitch) / 12
+    porch_slope_length = math.hypot(porch_run, porch_rise)
+
+    # Calculate sheets needed
+    porch_length_with_overhang = porch_length + overhang_ft
+    porch_sheets = math.ceil(porch_length_with_overhang / sheet_width_ft)
+
+    # Calculate linear feet and perimeter
+    porch_linear_feet = porch_sheets * porch_slope_length
+    porch_perimeter = (porch_length * 2) + porch_depth
+    porch_sheet_length = math.ceil(porch_slope_length * 2) / 2  # Round up to 0.5'
+
+    return porch_sheets, porch_sheet_length, porch_linear_feet, porch_perimeter
+
+def _core_source_hash() -> int:
+    """
+    Hash of the _sheathing_core and _porch_core source code.
+
+    build_core.py bakes this into the AOT module so a build made from older
+    source can be detected at import.
+    """
+    source = "".join(inspect.getsource(getattr(func, "py_func", func))
+                     for func in (_sheathing_core, _porch_core))
+    return int.from_bytes(hashlib.sha256(source.encode()).digest()[:7], "big")
+
+# Prefer the ahead-of-time build from build_core.py when it has been compiled;
+# it has no JIT warm-up and does not need numba at runtime. A build whose
+# source hash no longer matches this file is ignored.
+try:
+    from . import sheathing_core as _aot
+except ImportError:
+    _aot = None
+
+if _aot is not None:
+    if hasattr(_aot, "source_hash") and _aot.source_hash() == _core_source_hash():
+        _sheathing_core, _porch_core = _aot.calc_core, _aot.porch_core
+    else:
+        warnings.warn(
+            "sheathing_core was built from a different core.py and is ignored; "
+            "rebuild it with: python -m sheathing.build_core",
+            RuntimeWarning
+        )
+
+@lru_cache(maxsize=256)
+def _calc_cached(length, width, height, pitch, overhang, sheet_width,
+                 porch_length=None, porch_depth=None, porch_pitch=None) -> tuple:
+    """
+    Memoized sheathing calculation that works without a Streamlit runtime.
+
+    Arguments must be floats (porch values None when there is no porch) so
+    equal inputs share one cache entry. The result is the calculate_sheathing
+    dict frozen into nested (key, value) tuples, with the gable lengths as a
+    tuple, so cached entries are read-only. Call _calc_cached.cache_clear()
+    to reset it.
+    """
+    (eave_wall_sheets, wall_sheet_length, total_roof_sheets, roof_sheet_length,
+     gable_width, eave_length, gable_sheet_lengths) = _sheathing_core(
+        length, width, height, pitch, overhang, sheet_width)
+    gable_sheet_lengths = tuple(gable_sheet_lengths.tolist())
+
+    # Calculate linear feet
+    wall_linear_feet = eave_wall_sheets * wall_sheet_length
+    gable_linear_feet = sum(gable_sheet_lengths) * 2  # Double for both sides
+    roof_linear_feet = total_roof_sheets * roof_sheet_length
+
+    # Calculate perimeter feet
+    perimeter_feet = (eave_length * 2) + (gable_width * 2)
+
+    result = (
+        ("Eave Walls", (
+            ("Sheets", eave_wall_sheets),
+            ("Sheet Length", wall_sheet_length),
+            ("Linear Feet", wall_linear_feet),
+            ("Perimeter Feet", eave_length * 2)
+        )),
+        ("Gable Triangles", (
+            ("Sheets", len(gable_sheet_lengths) * 2),
+            ("Sheet Lengths", gable_sheet_lengths),
+            ("Linear Feet", gable_linear_feet),
+            ("Perimeter Feet", gable_width * 2)
+        )),
+        ("Roof", (
+            ("Sheets", total_roof_sheets),
+            ("Sheet Length", roof_sheet_length),
+            ("Linear Feet", roof_linear_feet),
+            ("Perimeter Feet", perimeter_feet)
+        ))
+    )
+
+    # Calculate porch roof if parameters provided
+    if porch_length is not None:
+        porch_sheets, porch_sheet_length, porch_linear_feet, porch_perimeter = _porch_core(
+            porch_length, porch_depth, porch_pitch, overhang, sheet_width)
+
+        result += (
+            ("Porch Roof", (
+                ("Sheets", porch_sheets),
+                ("Sheet Length", porch_sheet_length),
+                ("Linear Feet", porch_linear_feet),
+                ("Perimeter Feet", porch_perimeter)
+            )),
+        )
+
+    return result
+
+def calculate_sheathing(length: float, width: float, height: float, pitch: float, 
+                       overhang: float, sheet_width: float, porch_params: dict = None) -> dict:
+    """
+    Dynamically calculates the required metal sheets for walls, gable ends, roof, and optional porch.
+
+    Args:
+        length (float): Length of the building in feet
+        width (float): Width of the building in feet
+        height (float): Wall height in feet
+        pitch (float): Roof pitch (x/12)
+        overhang (float): Overhang length in inches
+        sheet_width (float): Sheet width in inches
+        porch_params (dict, optional): Dictionary containing porch dimensions:
+            - length: Length of porch in feet
+            - depth: Depth of porch in feet
+            - pitch: Porch roof pitch (x/12)
+
+    Returns:
+        dict: Dictionary containing sheathing calculations
+
+    Raises:
+        ValueError: If a dimension used to count sheets is NaN or infinite
+    """
+    porch_args = ()
+    if porch_params:
+        porch_args = (float(porch_params['length']), float(porch_params['depth']),
+                      float(porch_params['pitch']))
+
+    args = (float(length), float(width), float(height), float(pitch),
+            float(overhang), float(sheet_width))
+
+    # Sheet counts round these up with math.ceil, which raises on NaN/inf in
+    # plain Python but silently gives 0 under numba; reject them up front so
+    # both paths agree. A NaN height only reaches np.floor and propagates.
+    for name, value in zip(("length", "width", "pitch", "overhang", "sheet_width",
+                            "porch length", "porch depth", "porch pitch"),
+                           args[:2] + args[3:] + porch_args):
+        if not math.isfinite(value):
+            raise ValueError(f"{name} must be a finite number, got {value!r}")
+
+    cached = _calc_cached(*args, *porch_args)
+
+    # Rebuild a fresh, mutable dict so callers cannot alter the cached entry
+    result = {section: dict(details) for section, details in cached}
+    gable = result["Gable Triangles"]
+    gable["Sheet Lengths"] = list(gable["Sheet Lengths"])
+    return result
+
+def calculate_sheathing_batch(length, width, height, pitch, overhang, sheet_width) -> dict:
+    """
+    Vectorized calculate_sheathing for parameter sweeps (main building only, no porch).
+
+    Args:
+        length (array_like): Length of the building in feet
+        width (array_like): Width of the building in feet
+        height (array_like): Wall height in feet
+        pitch (array_like): Roof pitch (x/12)
+        overhang (array_like): Overhang length in inches
+        sheet_width (array_like): Sheet width in inches
+
+    All arguments are broadcast against each other.
+
+    Returns:
+        dict: Same sections and keys as calculate_sheathing, with an array per
+            value. "Gable Triangles" has an extra "Sheets Per Side" array, and
+            its "Sheet Lengths" array has one trailing axis of length
+            2 * max(sheets_per_side), padded with NaN after each building's
+            own lengths
+    """
+    length, width, height, pitch, overhang, sheet_width = np.broadcast_arrays(
+        *(np.asarray(a, dtype=np.float64)
+          for a in (length, width, height, pitch, overhang, sheet_width)))
+
+    # Convert sheet width and overhang from inches to feet
+    sheet_width_ft = sheet_width / 12
+    overhang_ft = overhang / 12
+
+    # Adjust building dimensions for overhang
+    gable_width = width + 2 * overhang_ft
+    eave_length = length + 2 * overhang_ft
+    half_gable_width = gable_width / 2
+    peak_height = half_gable_width * (pitch / 12)
+
+    # Gable sheets per side (degenerate widths have none) and rise per sheet
+    sheets_per_side = np.maximum(np.ceil(width / (2 * sheet_width_ft)), 0).astype(np.int64)
+    rise_per_sheet_inches = np.ceil((sheet_width * pitch) / 12)
+    start_inches = np.floor(height * 12 + 0.5) + rise_per_sheet_inches  # Half inches round up
+
+    # Ascending lengths in whole inches, then mirrored into each building's
+    # own 2 * n slots of a NaN-padded array
+    n = sheets_per_side[..., None]
+    slot = np.arange(2 * int(sheets_per_side.max(initial=0)))
+    step = np.where(slot < n, slot, 2 * n - 1 - slot)
+    gable_sheet_lengths = np.where(
+        slot < 2 * n,
+        (start_inches[..., None] + step * rise_per_sheet_inches[..., None]) / 12,
+        np.nan)
+
+    # Walls
+    eave_wall_sheets = np.ceil(length / sheet_width_ft).astype(np.int64) * 2
+    wall_sheet_length = height.copy()  # Don't hand back the caller's array or a broadcast view
+
+    # Roof
+    roof_slope_length = np.hypot(half_gable_width, peak_height)
+    total_roof_sheets = np.ceil(eave_length / sheet_width_ft).astype(np.int64) * 2
+    roof_sheet_length = np.ceil(roof_slope_length * 2) / 2  # Round up to 0.5'
+
+    return {
+        "Eave Walls": {
+            "Sheets": eave_wall_sheets,
+            "Sheet Length": wall_sheet_length,
+            "Linear Feet": eave_wall_sheets * wall_sheet_length,
+            "Perimeter Feet": eave_length * 2
+        },
+        "Gable Triangles": {
+            "Sheets": sheets_per_side * 4,
+            "Sheets Per Side": sheets_per_side,
+            "Sheet Lengths": gable_sheet_lengths,
+            "Linear Feet": np.where(slot < 2 * n, gable_sheet_lengths, 0).sum(axis=-1) * 2,
+            "Perimeter Feet": gable_width * 2
+        },
+        "Roof": {
+            "Sheets": total_roof_sheets,
+            "Sheet Length": roof_sheet_length,
+            "Linear Feet": total_roof_sheets * roof_sheet_length,
+            "Perimeter Feet": (eave_length * 2) + (gable_width * 2)
+        }
+    }
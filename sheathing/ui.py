@@ -0,0 +1,135 @@
+import streamlit as st
+from typing import Optional
+import pandas as pd
+
+
+# Static page copy, built once at import
+_INTRO_MD = """
+This calculator helps you determine the number of sheets needed for wall and roof sheathing
+in your construction project. Enter the building dimensions below to get started.
+"""
+
+_NOTES_MD = """
+- Sheet counts are rounded up to the nearest whole number
+- Gable triangle sections use staggered sheet lengths for optimal coverage
+- All measurements assume standard construction practices
+- Additional material should be ordered to account for waste and cuts
+"""
+
+_FOOTER_HTML = """
+<div style='text-align: center; color: #666;'>
+    <small>Made for construction professionals | All calculations are estimates</small>
+</div>
+"""
+
+# Form layout: one (heading, porch_only, fields) entry per column, where each
+# field is (calculate_sheathing keyword, label, st.number_input kwargs)
+INPUT_SPECS = (
+    ("### Building Dimensions", False, (
+        ("length", "Building Length (ft)", dict(
+            min_value=1.0, max_value=200.0, value=40.0,
+            help="Enter the length of the building in feet")),
+        ("width", "Building Width (ft)", dict(
+            min_value=1.0, max_value=200.0, value=30.0,
+            help="Enter the width of the building in feet")),
+        ("height", "Wall Height (ft)", dict(
+            min_value=1.0, max_value=40.0, value=10.0,
+            help="Enter the height of the walls in feet")),
+    )),
+    ("### Roof Specifications", False, (
+        ("pitch", "Main Roof Pitch (x/12)", dict(
+            min_value=1.0, max_value=12.0, value=4.0,
+            help="Enter the roof pitch (rise over run, e.g., 4 for a 4/12 pitch)")),
+        ("overhang", "Overhang (inches)", dict(
+            min_value=0.0, max_value=48.0, value=16.0,
+            help="Enter the overhang length in inches")),
+        ("sheet_width", "Sheet Width (inches)", dict(
+            min_value=10.0, max_value=48.0, value=36.0,
+            help="Enter the width of the sheathing sheets in inches")),
+    )),
+    ("### Porch Specifications", True, (
+        ("porch_length", "Porch Length (ft)", dict(
+            min_value=0.0, max_value=200.0, value=0.0,
+            help="Enter the length of the porch in feet")),
+        ("porch_depth", "Porch Depth (ft)", dict(
+            min_value=0.0, max_value=40.0, value=0.0,
+            help="Enter the depth of the porch in feet")),
+        ("porch_pitch", "Porch Roof Pitch (x/12)", dict(
+            min_value=1.0, max_value=12.0, value=4.0,
+            help="Enter the porch roof pitch (rise over run)")),
+    )),
+)
+
+
+def render_header():
+    """Render the title and introduction."""
+    st.title("🏗️ Construction Sheathing Calculator")
+    st.markdown(_INTRO_MD)
+
+
+def build_inputs() -> Optional[dict]:
+    """
+    Render the porch toggle and the input form.
+
+    Returns:
+        dict: Keyword arguments for calculate_sheathing once the form is
+            submitted, otherwise None
+    """
+    # Initialize session state for porch checkbox
+    if 'has_porch' not in st.session_state:
+        st.session_state.has_porch = False
+
+    # Porch checkbox outside the form
+    st.session_state.has_porch = st.checkbox("Include Porch Roof", value=st.session_state.has_porch)
+
+    # Input form
+    with st.form("sheathing_calculator"):
+        values = {}
+        for column, (heading, porch_only, specs) in zip(st.columns(3), INPUT_SPECS):
+            with column:
+                st.markdown(heading)
+                for key, label, kwargs in specs:
+                    values[key] = st.number_input(
+                        label,
+                        disabled=porch_only and not st.session_state.has_porch,
+                        **kwargs
+                    )
+
+        calculate_button = st.form_submit_button("Calculate Sheathing")
+
+    if not calculate_button:
+        return None
+
+    porch_params = None
+    porch_length = values.pop("porch_length")
+    porch_depth = values.pop("porch_depth")
+    porch_pitch = values.pop("porch_pitch")
+    if st.session_state.has_porch and porch_length > 0 and porch_depth > 0:
+        porch_params = {
+            "length": porch_length,
+            "depth": porch_depth,
+            "pitch": porch_pitch
+        }
+
+    values["porch_params"] = porch_params
+    return values
+
+
+def show_results(results_df: pd.DataFrame):
+    """Render the results table followed by the calculation notes."""
+    st.markdown("### 📊 Calculation Results")
+    st.dataframe(
+        results_df,
+        hide_index=True,
+        use_container_width=True
+    )
+
+    # Additional information
+    st.markdown("### 📝 Notes")
+    st.markdown(_NOTES_MD)
+
+
+def render_footer():
+    """Render the page footer."""
+    st.markdown("---")
+    st.markdown(_FOOTER_HTML, unsafe_allow_html=True)
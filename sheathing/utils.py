@@ -0,0 +1,127 @@
+import math
+from typing import TYPE_CHECKING
+import streamlit as st
+from .core import calculate_sheathing
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+def _ceil3(x: float) -> int:
+    """Round linear feet up to the next multiple of 3 (3' sections)."""
+    i = math.ceil(x)
+    return i + (-i) % 3
+
+def _format_columns(results: dict) -> dict:
+    """
+    Format calculation results as display columns, including the total row.
+
+    Args:
+        results (dict): Dictionary containing sheathing calculations
+
+    Returns:
+        dict: Column name -> list of formatted cell values
+    """
+    sections = []
+    sheets = []
+    sheet_lengths = []
+    linear_feet = []
+    perimeter_feet = []
+    notes = []
+    total_linear_feet = 0
+
+    for section, details in results.items():
+        rounded_linear_feet = _ceil3(details['Linear Feet'])
+        sections.append(section)
+        sheets.append(details["Sheets"])
+        if section == "Gable Triangles":
+            lengths_str = ", ".join(f"{length:.1f}'" for length in details["Sheet Lengths"])
+            sheet_lengths.append(f"Variable: {lengths_str}")
+            notes.append("Staggered lengths for optimal coverage")
+        else:
+            sheet_lengths.append(f"{details['Sheet Length']:.1f}'")
+            notes.append("")
+        linear_feet.append(f"{rounded_linear_feet:.1f}'")
+        perimeter_feet.append(f"{details['Perimeter Feet']:.1f}'")
+        total_linear_feet += rounded_linear_feet
+
+    # Add total row
+    sections.append("TOTAL")
+    sheets.append(sum(sheets))
+    sheet_lengths.append("-")
+    linear_feet.append(f"{total_linear_feet:.1f}'")
+    perimeter_feet.append(f"{results['Roof']['Perimeter Feet']:.1f}'")
+    notes.append("Total linear feet required")
+
+    return {
+        "Section": sections,
+        "Number of Sheets": sheets,
+        "Sheet Length (ft)": sheet_lengths,
+        "Total Linear Feet (3' Sections)": linear_feet,
+        "Perimeter Feet": perimeter_feet,
+        "Notes": notes
+    }
+
+def format_results_rows(results: dict) -> list:
+    """
+    Format calculation results as a list of row dicts, without pandas.
+
+    Args:
+        results (dict): Dictionary containing sheathing calculations
+
+    Returns:
+        list: One dict per table row, keyed by column name
+    """
+    columns = _format_columns(results)
+    return [dict(zip(columns, row)) for row in zip(*columns.values())]
+
+def format_results_df(results: dict) -> "pd.DataFrame":
+    """
+    Format calculation results into a pandas DataFrame.
+
+    Args:
+        results (dict): Dictionary containing sheathing calculations
+
+    Returns:
+        pd.DataFrame: Formatted results
+    """
+    # Imported here so calculate_sheathing and format_results_rows don't pay for pandas
+    try:
+        import pandas as pd
+    except ImportError:
+        raise RuntimeError("install pandas to use format_results_df") from None
+
+    return pd.DataFrame(_format_columns(results))
+
+# Kept for callers written against the original name
+format_results = format_results_df
+
+@st.cache_resource(max_entries=256)
+def calc_and_format(length: float, width: float, height: float, pitch: float,
+                    overhang: float, sheet_width: float, porch_params: dict = None) -> "pd.DataFrame":
+    """
+    Calculate sheathing and format the results in one cached step.
+
+    Cached with st.cache_resource, so every hit returns the same DataFrame
+    instead of an unpickled copy; callers must not modify it.
+
+    Args:
+        length (float): Length of the building in feet
+        width (float): Width of the building in feet
+        height (float): Wall height in feet
+        pitch (float): Roof pitch (x/12)
+        overhang (float): Overhang length in inches
+        sheet_width (float): Sheet width in inches
+        porch_params (dict, optional): Porch dimensions, as for calculate_sheathing
+
+    Returns:
+        pd.DataFrame: Formatted results
+    """
+    return format_results_df(calculate_sheathing(
+        length=length,
+        width=width,
+        height=height,
+        pitch=pitch,
+        overhang=overhang,
+        sheet_width=sheet_width,
+        porch_params=porch_params
+    ))
@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+from sheathing.core import calculate_sheathing, calculate_sheathing_batch
+
+
+def gable_lengths(height, pitch=4.0, sheet_width=36.0):
+    results = calculate_sheathing(length=40.0, width=30.0, height=height, pitch=pitch,
+                                  overhang=16.0, sheet_width=sheet_width)
+    return results["Gable Triangles"]["Sheet Lengths"]
+
+
+def test_gable_lengths_step_by_whole_inches():
+    # 36" sheets at 4/12 rise 12" per sheet, starting one step above the wall
+    assert gable_lengths(10.0) == [11.0, 12.0, 13.0, 14.0, 15.0, 15.0, 14.0, 13.0, 12.0, 11.0]
+
+
+@pytest.mark.parametrize("height, first_inches", [
+    (124.5 / 12, 125 + 12),  # half inch rounds up, never short
+    (124.4 / 12, 124 + 12),
+    (124.6 / 12, 125 + 12),
+])
+def test_wall_height_rounds_half_inch_up(height, first_inches):
+    lengths = gable_lengths(height)
+    assert lengths[0] == pytest.approx(first_inches / 12)
+    assert lengths[-1] == lengths[0]
+
+
+def test_batch_matches_calculate_sheathing():
+    rng = np.random.default_rng(0)
+    n = 300
+    length = rng.uniform(1, 200, n)
+    width = rng.uniform(1, 200, n)
+    width[:3] = [0.0, -12.0, 0.5]  # no gable sheets, and a single pair
+    height = rng.integers(24, 480, n) / 24  # half-inch steps included
+    pitch = rng.uniform(1, 12, n)
+    overhang = rng.uniform(0, 48, n)
+    sheet_width = rng.choice([24.0, 36.0, 48.0], n)
+
+    batch = calculate_sheathing_batch(length, width, height, pitch, overhang, sheet_width)
+    for details in batch.values():
+        for value in details.values():
+            for arg in (length, width, height, pitch, overhang, sheet_width):
+                assert not np.shares_memory(value, arg)
+
+    for i in range(n):
+        expected = calculate_sheathing(length[i], width[i], height[i], pitch[i],
+                                       overhang[i], sheet_width[i])
+        for section, details in expected.items():
+            for key, value in details.items():
+                got = batch[section][key][i]
+                if key == "Sheet Lengths":
+                    own = 2 * batch["Gable Triangles"]["Sheets Per Side"][i]
+                    assert got[:own].tolist() == pytest.approx(value)
+                    assert np.isnan(got[own:]).all()
+                else:
+                    assert got == pytest.approx(value), (section, key, i)
+
+
+def test_batch_copies_broadcast_height():
+    batch = calculate_sheathing_batch([40.0, 50.0], 30.0, 10.0, 4.0, 16.0, 36.0)
+    wall_lengths = batch["Eave Walls"]["Sheet Length"]
+    wall_lengths[0] = 99.0
+    assert wall_lengths.tolist() == [99.0, 10.0]
+
+
+def test_batch_propagates_nan_like_calculate_sheathing():
+    expected = calculate_sheathing(40.0, 30.0, float("nan"), 4.0, 16.0, 36.0)
+    batch = calculate_sheathing_batch(40.0, 30.0, np.nan, 4.0, 16.0, 36.0)
+    assert np.isnan(expected["Gable Triangles"]["Linear Feet"])
+    assert np.isnan(batch["Gable Triangles"]["Linear Feet"])
+
+
+@pytest.mark.parametrize("field", ["length", "width", "pitch", "overhang", "sheet_width"])
+@pytest.mark.parametrize("bad", [float("nan"), float("inf")])
+def test_non_finite_dimensions_raise(field, bad):
+    kwargs = dict(length=40.0, width=30.0, height=10.0, pitch=4.0, overhang=16.0, sheet_width=36.0)
+    kwargs[field] = bad
+    with pytest.raises(ValueError):
+        calculate_sheathing(**kwargs)
+
+
+def test_non_finite_porch_dimension_raises():
+    with pytest.raises(ValueError):
+        calculate_sheathing(40.0, 30.0, 10.0, 4.0, 16.0, 36.0,
+                            {"length": 20.0, "depth": float("nan"), "pitch": 4.0})
@@ -0,0 +1,74 @@
+import math
+import numpy as np
+import pytest
+from sheathing.core import calculate_sheathing
+from sheathing.utils import _ceil3, format_results_df, format_results_rows
+
+PORCH = {"length": 20.0, "depth": 10.0, "pitch": 4.0}
+
+
+def default_results(porch_params=None):
+    return calculate_sheathing(length=40.0, width=30.0, height=10.0, pitch=4.0,
+                               overhang=16.0, sheet_width=36.0, porch_params=porch_params)
+
+
+def test_default_table_with_porch():
+    rows = format_results_rows(default_results(PORCH))
+    table = [(row["Section"], row["Number of Sheets"], row["Sheet Length (ft)"],
+              row["Total Linear Feet (3' Sections)"], row["Perimeter Feet"]) for row in rows]
+    assert table == [
+        ("Eave Walls", 28, "10.0'", "282.0'", "85.3'"),
+        ("Gable Triangles", 20,
+         "Variable: 11.0', 12.0', 13.0', 14.0', 15.0', 15.0', 14.0', 13.0', 12.0', 11.0'",
+         "261.0'", "65.3'"),
+        ("Roof", 30, "17.5'", "525.0'", "150.7'"),
+        ("Porch Roof", 8, "12.0'", "96.0'", "50.0'"),
+        ("TOTAL", 86, "-", "1164.0'", "150.7'"),
+    ]
+    assert rows[1]["Notes"] == "Staggered lengths for optimal coverage"
+    assert rows[-1]["Notes"] == "Total linear feet required"
+
+
+def test_default_total_without_porch():
+    rows = format_results_rows(default_results())
+    assert [row["Section"] for row in rows] == ["Eave Walls", "Gable Triangles", "Roof", "TOTAL"]
+    assert rows[-1]["Total Linear Feet (3' Sections)"] == "1068.0'"
+
+
+def test_rows_match_dataframe_records():
+    rng = np.random.default_rng(0)
+    for _ in range(100):
+        porch = None
+        if rng.random() < 0.5:
+            porch = {"length": rng.uniform(1, 200), "depth": rng.uniform(1, 40),
+                     "pitch": rng.uniform(1, 12)}
+        results = calculate_sheathing(rng.uniform(1, 200), rng.uniform(1, 200),
+                                      rng.uniform(1, 40), rng.uniform(1, 12),
+                                      rng.uniform(0, 48), rng.uniform(10, 48), porch)
+        assert format_results_rows(results) == format_results_df(results).to_dict("records")
+
+
+@pytest.mark.parametrize("x, expected", [
+    (0.0, 0),
+    (3.0, 3),
+    (282.0, 282),
+    (3000.0, 3000),
+    (math.nextafter(3.0, 0), 3),
+    (math.nextafter(3.0, math.inf), 6),
+    (math.nextafter(282.0, 0), 282),
+    (math.nextafter(282.0, math.inf), 285),
+    (math.nextafter(3000.0, 0), 3000),
+    (math.nextafter(3000.0, math.inf), 3003),
+    (0.1, 3),
+    (282.5, 285),
+    (283.0, 285),
+    (1067.2, 1068),
+])
+def test_ceil3_matches_divide_and_ceil(x, expected):
+    assert _ceil3(x) == expected
+    assert _ceil3(x) == math.ceil(x / 3) * 3
+
+
+def test_ceil3_rounds_tiny_footage_up():
+    # x / 3 underflows to 0 here, so only the integer form rounds up
+    assert _ceil3(math.nextafter(0.0, 1.0)) == 3